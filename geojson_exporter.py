@@ -1,11 +1,17 @@
 import json
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 def create_geojson(places, path, output_file="route.geojson"):
     """
     Create a GeoJSON LineString representing the path
     """
     # Extract coordinates for the path
-    coordinates = [[places[i].lon, places[i].lat] for i in path]
+    coordinates = np.column_stack((places.lons[path], places.lats[path])).tolist()
     
     # Create GeoJSON structure
     geojson = {
@@ -22,8 +28,12 @@ def create_geojson(places, path, output_file="route.geojson"):
         ]
     }
     
-    # Write to file
-    with open(output_file, 'w') as f:
-        json.dump(geojson, f, indent=2)
+    # Write to file, using orjson's C encoder when it is installed
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(geojson, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(geojson, f, indent=2)
     
     return output_file
\ No newline at end of file
@@ -0,0 +1,42 @@
+import math
+import numpy as np
+from numba import njit, prange
+
+@njit(parallel=True, fastmath=True, cache=True)
+def haversine_matrix(lats, lons):
+    """
+    Calculate the great circle distance between every pair of points
+    (specified as arrays of latitudes and longitudes in radians)
+    """
+    n = lats.shape[0]
+    r = 6371  # Radius of earth in kilometers
+    
+    # Per-point trig terms, so the pair loop needs no sin/cos at all:
+    # sin((b - a)/2) = sin(b/2)cos(a/2) - cos(b/2)sin(a/2)
+    sin_hlat = np.empty(n)
+    cos_hlat = np.empty(n)
+    sin_hlon = np.empty(n)
+    cos_hlon = np.empty(n)
+    cos_lat = np.empty(n)
+    for i in range(n):
+        sin_hlat[i] = math.sin(lats[i]/2)
+        cos_hlat[i] = math.cos(lats[i]/2)
+        sin_hlon[i] = math.sin(lons[i]/2)
+        cos_hlon[i] = math.cos(lons[i]/2)
+        cos_lat[i] = math.cos(lats[i])
+    
+    # Distances are symmetric: compute the upper triangle and mirror it.
+    # Results are stored as float32 to halve the matrix's memory traffic.
+    matrix = np.empty((n, n), dtype=np.float32)
+    for i in prange(n):
+        matrix[i, i] = 0.0
+        for j in range(i + 1, n):
+            # Haversine formula
+            sin_dlat = sin_hlat[j] * cos_hlat[i] - cos_hlat[j] * sin_hlat[i]
+            sin_dlon = sin_hlon[j] * cos_hlon[i] - cos_hlon[j] * sin_hlon[i]
+            a = sin_dlat**2 + cos_lat[i] * cos_lat[j] * sin_dlon**2
+            d = 2 * r * math.asin(min(1.0, math.sqrt(a)))
+            matrix[i, j] = d
+            matrix[j, i] = d
+    
+    return matrix
@@ -0,0 +1,31 @@
+import numpy as np
+from numba import njit
+
+@njit(cache=True)
+def greedy_tsp_nb(distance_matrix, start_index=0):
+    """
+    Greedy algorithm for TSP, compiled with Numba:
+    1. Start at the specified index
+    2. Repeatedly visit the nearest unvisited place
+    """
+    n = distance_matrix.shape[0]
+    visited = np.zeros(n, dtype=np.bool_)
+    path = np.empty(n, dtype=np.int64)
+    path[0] = start_index
+    visited[start_index] = True
+    
+    # Visit all remaining places
+    for k in range(1, n):
+        current = path[k - 1]
+        next_place = -1
+        min_distance = np.inf
+        
+        for candidate in range(n):
+            if not visited[candidate] and distance_matrix[current, candidate] < min_distance:
+                next_place = candidate
+                min_distance = distance_matrix[current, candidate]
+        
+        path[k] = next_place
+        visited[next_place] = True
+    
+    return path
@@ -1,4 +1,87 @@
+import csv
+import math
+import os
 from collections import namedtuple
+import numpy as np
 
 # Define a Place namedtuple to store location information
-Place = namedtuple('Place', ['name', 'lat', 'lon'])
\ No newline at end of file
+Place = namedtuple('Place', ['name', 'lat', 'lon'])
+
+# Importing pandas takes ~0.4 s, which its C parser only wins back on large files
+PANDAS_MIN_BYTES = 32 * 1024 * 1024
+
+class Places:
+    """
+    A collection of places stored as parallel arrays: a list of names
+    and float64 NumPy arrays of latitudes and longitudes
+    """
+    def __init__(self, names, lats, lons):
+        self.names = list(names)
+        self.lats = np.asarray(lats, dtype=np.float64)
+        self.lons = np.asarray(lons, dtype=np.float64)
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def __getitem__(self, index):
+        """Return a single place as a Place"""
+        return Place(self.names[index], float(self.lats[index]), float(self.lons[index]))
+
+def read_places_from_csv(csv_file):
+    """Read places from a CSV file"""
+    # Use pandas' C parser for large files when it is installed
+    pd = None
+    if os.path.getsize(csv_file) >= PANDAS_MIN_BYTES:
+        try:
+            import pandas as pd
+        except ImportError:
+            pd = None
+    
+    if pd is not None:
+        # A header row would leave both coordinate columns as strings, so skip it up front
+        with open(csv_file, 'r', newline='') as f:
+            first_row = next(csv.reader(f), [])
+        try:
+            float(first_row[1])
+            float(first_row[2])
+            skiprows = 0
+        except (IndexError, ValueError):
+            skiprows = 1
+        try:
+            frame = pd.read_csv(csv_file, header=None, names=['name', 'lat', 'lon'],
+                                usecols=[0, 1, 2], skiprows=skiprows, dtype={'name': object},
+                                keep_default_na=False, low_memory=False)
+        except (pd.errors.EmptyDataError, pd.errors.ParserError):
+            # No rows at all, or no row with name, lat and lon
+            return Places([], [], [])
+        lats, lons = frame['lat'], frame['lon']
+        # Only a header or junk rows leave a coordinate column non-numeric
+        if not pd.api.types.is_numeric_dtype(lats):
+            lats = pd.to_numeric(lats, errors='coerce')
+        if not pd.api.types.is_numeric_dtype(lons):
+            lons = pd.to_numeric(lons, errors='coerce')
+        lats = lats.to_numpy(dtype=float)
+        lons = lons.to_numpy(dtype=float)
+        
+        # Skip header or invalid rows; NaN/inf coordinates count as invalid
+        valid = np.isfinite(lats) & np.isfinite(lons)
+        return Places(frame['name'].to_numpy()[valid], lats[valid], lons[valid])
+    
+    names, lats, lons = [], [], []
+    with open(csv_file, 'r') as f:
+        reader = csv.reader(f)
+        for row in reader:
+            if len(row) >= 3:  # Ensure we have name, lat, lon
+                try:
+                    lat = float(row[1])
+                    lon = float(row[2])
+                except ValueError:
+                    # Skip header or invalid rows
+                    continue
+                if not (math.isfinite(lat) and math.isfinite(lon)):
+                    # Skip rows with NaN/inf coordinates too
+                    continue
+                names.append(row[0])
+                lats.append(lat)
+                lons.append(lon)
+    return Places(names, lats, lons)
\ No newline at end of file
@@ -0,0 +1,159 @@
+import numpy as np
+
+# Minimum gain (in km) for a 2-opt move to count as an improvement
+IMPROVEMENT_TOLERANCE = 1e-9
+
+# Number of nearest neighbors each place tries to connect to in 2-opt
+NEIGHBOR_COUNT = 20
+
+# Importing numba and loading the cached greedy kernel takes ~0.4 s, which
+# it only wins back over the NumPy version on large inputs
+NUMBA_MIN_PLACES = 15000
+
+def greedy_tsp(distance_matrix, start_index=0):
+    """
+    Greedy algorithm for TSP:
+    1. Start at the specified index
+    2. Repeatedly visit the nearest unvisited place
+    """
+    n = len(distance_matrix)
+    
+    # Use the Numba-compiled version for large inputs when numba is installed
+    if n >= NUMBA_MIN_PLACES:
+        try:
+            from numba_tsp import greedy_tsp_nb
+        except ImportError:
+            greedy_tsp_nb = None
+        if greedy_tsp_nb is not None:
+            return greedy_tsp_nb(np.ascontiguousarray(distance_matrix), start_index).tolist()
+    
+    visited = np.zeros(n, dtype=bool)
+    path = [start_index]
+    visited[start_index] = True
+    
+    # Visit all remaining places
+    for _ in range(n - 1):
+        current = path[-1]
+        
+        # Mask out visited places and take the nearest of the rest
+        distances = np.array(distance_matrix[current])
+        distances[visited] = np.inf
+        next_place = int(distances.argmin())
+        
+        path.append(next_place)
+        visited[next_place] = True
+    
+    return path
+
+def calculate_path_distance(path, distance_matrix):
+    """Calculate the total distance of a path"""
+    # Sum the float32 distances in a float64 accumulator to avoid drift
+    path = np.asarray(path, dtype=np.int64)
+    return float(distance_matrix[path[:-1], path[1:]].sum(dtype=np.float64))
+
+def nearest_neighbors(distance_matrix, count=NEIGHBOR_COUNT):
+    """For every place, list the indices of its nearest other places, closest first"""
+    distances = np.array(distance_matrix)
+    np.fill_diagonal(distances, np.inf)
+    count = max(0, min(count, len(distances) - 1))
+    if count == 0:
+        return [[] for _ in range(len(distances))]
+    
+    # Select the closest count places per row without sorting whole rows,
+    # then order just those, breaking ties by index
+    closest = np.sort(np.argpartition(distances, count - 1, axis=1)[:, :count], axis=1)
+    order = np.argsort(np.take_along_axis(distances, closest, axis=1), axis=1, kind='stable')
+    return np.take_along_axis(closest, order, axis=1).tolist()
+
+def two_opt_improvement(path, distance_matrix, neighbor_count=NEIGHBOR_COUNT):
+    """
+    2-opt improvement algorithm:
+    Try 2-opt swaps that connect a place to one of its nearest neighbors
+    and apply them if they improve the solution.
+    Returns the improved path and its total distance
+    """
+    improved = True
+    best_path = list(path)
+    best_distance = calculate_path_distance(best_path, distance_matrix)
+    n = len(best_path)
+    
+    # Read entries as Python floats so move gains are computed in double
+    # precision even when the matrix is stored as float32
+    distance = distance_matrix.item
+    neighbors = nearest_neighbors(distance_matrix, neighbor_count)
+    position = [0] * len(distance_matrix)
+    for index, place in enumerate(best_path):
+        position[place] = index
+    
+    # Don't-look bits, indexed by place: set once every move adding an edge
+    # from a place to one of its neighbors has been tried without improvement
+    dont_look = [False] * len(distance_matrix)
+    
+    while improved:
+        improved = False
+        for t1 in path:
+            if dont_look[t1]:
+                continue
+            
+            # Edge k joins path[k-1] and path[k]. Removing edges lo < hi and
+            # reversing path[lo..hi-1] adds (lo-1, hi-1) and (lo, hi).
+            # Try removing the edge before t1 (offset 0), then the edge after
+            # it (offset 1), and adding an edge from t1 to a near neighbor t3.
+            scan_improved = False
+            for offset in (0, 1):
+                i = position[t1]
+                edge = i + offset
+                if edge < 1 or edge > n - 1:
+                    continue
+                
+                t2 = best_path[edge - 1] if offset == 0 else best_path[edge]
+                removed = distance(t1, t2)
+                for t3 in neighbors[t1]:
+                    # Only look for moves whose new edge at t1 is shorter than
+                    # the one it replaces; neighbors are sorted, so stop. This
+                    # prunes the search, so the result need not be 2-opt optimal
+                    if distance(t1, t3) >= removed:
+                        break
+                    
+                    lo, hi = sorted((edge, position[t3] + offset))
+                    if lo < 1 or hi > n - 1 or hi - lo < 2:
+                        continue
+                    
+                    a, b = best_path[lo - 1], best_path[lo]
+                    c, d = best_path[hi - 1], best_path[hi]
+                    delta = distance(a, c) + distance(b, d) - distance(a, b) - distance(c, d)
+                    
+                    if delta < -IMPROVEMENT_TOLERANCE:
+                        best_path[lo:hi] = best_path[lo:hi][::-1]
+                        best_distance += delta
+                        # Every place from a to d has moved or has new edges
+                        for index in range(lo - 1, hi + 1):
+                            position[best_path[index]] = index
+                            dont_look[best_path[index]] = False
+                        scan_improved = True
+                        improved = True
+                        # t1's edges have changed, so move on
+                        break
+            
+            if not scan_improved:
+                dont_look[t1] = True
+    
+    return best_path, best_distance
+
+def solve_tsp(distance_matrix, start_index=0, return_to_start=False):
+    """
+    Solve the TSP using greedy algorithm followed by 2-opt improvement.
+    Returns the path and its total distance
+    """
+    # Get initial solution using greedy algorithm
+    path = greedy_tsp(distance_matrix, start_index)
+    
+    # Improve solution using 2-opt, which keeps the tour length up to date
+    path, total_distance = two_opt_improvement(path, distance_matrix)
+    
+    # Add the start point at the end if return_to_start is True
+    if return_to_start:
+        total_distance += float(distance_matrix[path[-1], start_index])
+        path.append(start_index)
+    
+    return path, total_distance
\ No newline at end of file